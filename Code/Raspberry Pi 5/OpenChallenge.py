@@ -7,6 +7,7 @@ import queue
 import json
 import zmq
 import serial
+import profiling
 
 ZMQ_PORT_LIDAR = 5000
 ZMQ_PORT_IMU = 5001
@@ -52,6 +53,17 @@ def log(msg, category="info"):
 _serial_cmd_queue = queue.Queue()
 _stop_event = threading.Event()
 
+def decode_sensor_message(msg):
+    payload = msg
+    for pfx in ("imu ", "lidar ", "imu:", "lidar:"):
+        if msg.startswith(pfx):
+            payload = msg[len(pfx):].strip()
+            break
+    try:
+        return json.loads(payload)
+    except Exception:
+        return {"__raw__": payload}
+
 def zmq_listener_thread(loop, sensor_queue, stop_event):
     ctx = zmq.Context()
     sock = ctx.socket(zmq.SUB)
@@ -76,16 +88,7 @@ def zmq_listener_thread(loop, sensor_queue, stop_event):
                 loop.call_soon_threadsafe(sensor_queue.put_nowait, {"__error__": str(e)})
                 break
 
-            payload = msg
-            for pfx in ("imu ", "lidar ", "imu:", "lidar:"):
-                if msg.startswith(pfx):
-                    payload = msg[len(pfx):].strip()
-                    break
-            try:
-                data = json.loads(payload)
-            except Exception:
-                data = {"__raw__": payload}
-
+            data = decode_sensor_message(msg)
             loop.call_soon_threadsafe(sensor_queue.put_nowait, data)
     finally:
         try:
@@ -164,13 +167,13 @@ async def brake(servo_center: float = None):
         return await send_command("MA:0,MB:0")
     return await send_command(f"MA:0,MB:0,S:{servo_center}")
 
-async def process_queue():
+async def process_queue(sensor_worker=zmq_listener_thread, serial_worker=serial_worker_thread):
     loop = asyncio.get_running_loop()
     sensor_queue = asyncio.Queue()
     serial_in_queue = asyncio.Queue()
 
-    t_zmq = threading.Thread(target=zmq_listener_thread, args=(loop, sensor_queue, _stop_event), daemon=True)
-    t_serial = threading.Thread(target=serial_worker_thread, args=(loop, serial_in_queue, _serial_cmd_queue, _stop_event), daemon=True)
+    t_zmq = threading.Thread(target=sensor_worker, args=(loop, sensor_queue, _stop_event), daemon=True)
+    t_serial = threading.Thread(target=serial_worker, args=(loop, serial_in_queue, _serial_cmd_queue, _stop_event), daemon=True)
     t_zmq.start()
     t_serial.start()
 
@@ -392,7 +395,8 @@ async def process_queue():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(process_queue())
+        with profiling.profiled("openchallenge"):
+            asyncio.run(process_queue())
     except KeyboardInterrupt:
         print("\nKeyboardInterrupt, stopping...")
         _stop_event.set()
@@ -0,0 +1,11 @@
+"""Benchmarks for the Raspberry Pi sensor and control hot paths.
+
+Run from "Code/Raspberry Pi 5" so the live scripts are importable:
+
+    python3 -m bench                       # everything, JSON to bench-results/
+    python3 -m bench --quick --only lidar  # fast subset
+    python3 -m bench --compare bench-results/<older>.json
+
+See bench/traces.py for recording trace fixtures and profiling.py for the
+WRO_PROFILE switch in the live scripts.
+"""
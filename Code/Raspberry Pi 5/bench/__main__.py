@@ -0,0 +1,123 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import traceback
+
+from bench import hotpaths, pipeline, traces
+
+SCHEMA_VERSION = 1
+DEFAULT_OUTPUT_DIR = "bench-results"
+
+
+def _git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+    except Exception:
+        return None
+    return out.stdout.strip() or None
+
+
+def _environment():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "git_revision": _git_revision(),
+    }
+
+
+def _print_results(results, baseline=None):
+    base = {r["name"]: r for r in (baseline or {}).get("results", [])}
+    header = f"{'benchmark':40} {'throughput/s':>14} {'p50 us':>11} {'p99 us':>11}"
+    if base:
+        header += f" {'vs base':>9}"
+    print(header)
+    for r in results:
+        lat = r.get("latency_us", {})
+        tput = r.get("throughput_per_s")
+        tput = f"{tput:14.1f}" if tput is not None else f"{'-':>14}"
+        line = (f"{r['name']:40} {tput} "
+                f"{lat.get('p50', 0):11.2f} {lat.get('p99', 0):11.2f}")
+        old = base.get(r["name"])
+        if old and old.get("latency_us", {}).get("p50"):
+            line += f" {lat.get('p50', 0) / old['latency_us']['p50']:8.2f}x"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m bench", description="Benchmark the sensor and control hot paths.")
+    parser.add_argument("-o", "--output", help="JSON results file (default: bench-results/<timestamp>.json)")
+    parser.add_argument("--fixtures", default=traces.FIXTURES_DIR,
+                        help="trace fixture directory; missing files fall back to synthetic data")
+    parser.add_argument("--synthetic", action="store_true", help="ignore trace fixtures, use generated data")
+    parser.add_argument("--only", action="append", default=[],
+                        help="run benchmarks whose name contains this text (repeatable)")
+    parser.add_argument("--skip-pipeline", action="store_true")
+    parser.add_argument("--laps", type=int, help="pipeline laps (default 3, 1 with --quick)")
+    parser.add_argument("--flood", type=int,
+                        help="IMU readings per burst, 0 to skip (default 2000, 500 with --quick)")
+    parser.add_argument("--quick", action="store_true", help="short run for a smoke check")
+    parser.add_argument("--compare", help="earlier results JSON to show p50 ratios against")
+    args = parser.parse_args(argv)
+    if args.laps is None:
+        args.laps = 1 if args.quick else 3
+    if args.flood is None:
+        args.flood = 500 if args.quick else 2000
+
+    started = time.time()
+    def wanted(names):
+        return not args.only or any(s in n for s in args.only for n in names)
+
+    results = []
+    errors = []
+
+    def stage(name, func, *a, **kw):
+        # A failing stage is recorded in the report instead of discarding
+        # the results already measured.
+        try:
+            results.extend(func(*a, **kw))
+        except Exception as e:
+            traceback.print_exc()
+            errors.append({"stage": name, "error": f"{type(e).__name__}: {e}"})
+
+    if wanted(hotpaths.NAMES):
+        stage("hotpaths", hotpaths.run, None if args.synthetic else args.fixtures, quick=args.quick)
+    if not args.skip_pipeline and wanted(pipeline.NAMES):
+        stage("pipeline", pipeline.run, laps=args.laps, flood=args.flood)
+    if args.only:
+        results = [r for r in results if any(s in r["name"] for s in args.only)]
+
+    report = {
+        "schema": SCHEMA_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(started)),
+        "duration_s": round(time.time() - started, 3),
+        "quick": args.quick,
+        "environment": _environment(),
+        "results": results,
+        "errors": errors,
+    }
+
+    output = args.output or os.path.join(
+        DEFAULT_OUTPUT_DIR, time.strftime("%Y%m%d-%H%M%S", time.localtime(started)) + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    _print_results(results, baseline)
+    for err in errors:
+        print(f"\n{err['stage']} failed: {err['error']}", file=sys.stderr)
+    print(f"\nResults written to {output}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""Synthetic sensor data shaped like what the live scripts actually handle.
+
+Scans are lists of rplidarc1 point dicts ({"q", "a_deg", "d_mm"}) ray-cast
+inside a WRO open-challenge field. IMU data is raw BNO055 UART read responses
+(0xBB, length, payload) as returned by imu.send_command(). Messages are the
+frames OpenChallenge.zmq_listener_thread receives from recv_string().
+"""
+import json
+import math
+import random
+import struct
+import time
+
+FIELD_SIZE_MM = 3000
+ISLAND_SIZE_MM = 1000
+LIDAR_MAX_RANGE_MM = 12000
+POINTS_PER_ROTATION = 500
+
+
+def _ray_to_field(x, y, theta, field=FIELD_SIZE_MM, island=ISLAND_SIZE_MM):
+    dx = math.cos(theta)
+    dy = math.sin(theta)
+    best = math.inf
+    for pos, d, lo, hi in ((x, dx, 0.0, field), (y, dy, 0.0, field)):
+        if d > 1e-9:
+            best = min(best, (hi - pos) / d)
+        elif d < -1e-9:
+            best = min(best, (lo - pos) / d)
+
+    lo = (field - island) / 2.0
+    hi = lo + island
+    t_near = -math.inf
+    t_far = math.inf
+    for pos, d in ((x, dx), (y, dy)):
+        if abs(d) < 1e-9:
+            if pos < lo or pos > hi:
+                return best
+            continue
+        t1 = (lo - pos) / d
+        t2 = (hi - pos) / d
+        t_near = max(t_near, min(t1, t2))
+        t_far = min(t_far, max(t1, t2))
+    if t_near <= t_far and t_near > 0:
+        best = min(best, t_near)
+    return best
+
+
+def synthetic_scan(x=500.0, y=1500.0, heading=90.0, n_points=POINTS_PER_ROTATION,
+                   noise_mm=8.0, dropout=0.03, rng=None):
+    rng = rng or random.Random()
+    step = 360.0 / n_points
+    points = []
+    for i in range(n_points):
+        a_deg = (i * step + rng.uniform(0.0, step)) % 360.0
+        if rng.random() < dropout:
+            points.append({"q": 0, "a_deg": a_deg, "d_mm": None})
+            continue
+        dist = _ray_to_field(x, y, math.radians(heading + a_deg)) + rng.gauss(0.0, noise_mm)
+        if dist <= 0 or dist > LIDAR_MAX_RANGE_MM:
+            points.append({"q": 0, "a_deg": a_deg, "d_mm": None})
+            continue
+        points.append({"q": rng.randint(40, 60), "a_deg": a_deg, "d_mm": round(dist, 2)})
+    return points
+
+
+def synthetic_scans(count, n_points=POINTS_PER_ROTATION, seed=0):
+    rng = random.Random(seed)
+    corridor = (FIELD_SIZE_MM - ISLAND_SIZE_MM) / 4.0
+    scans = []
+    for i in range(count):
+        y = corridor + (FIELD_SIZE_MM - 2 * corridor) * i / max(1, count - 1)
+        x = corridor + rng.uniform(-150.0, 150.0)
+        heading = 90.0 + rng.uniform(-10.0, 10.0)
+        scans.append(synthetic_scan(x, y, heading, n_points=n_points, rng=rng))
+    return scans
+
+
+def euler_frame(heading, roll=0.0, pitch=0.0):
+    raw = [max(-32768, min(32767, int(round(v * 16.0)))) for v in (heading, roll, pitch)]
+    return bytes([0xBB, 0x06]) + struct.pack('<hhh', *raw)
+
+
+def synthetic_imu_frames(count, seed=0, bad_ratio=0.02):
+    rng = random.Random(seed)
+    frames = []
+    heading = 0.0
+    for _ in range(count):
+        heading = (heading + rng.uniform(-0.5, 1.5)) % 360.0
+        r = rng.random()
+        if r < bad_ratio / 2:
+            frames.append(bytes([0xEE, 0x07]))
+        elif r < bad_ratio:
+            frames.append(euler_frame(heading)[:5])
+        else:
+            frames.append(euler_frame(heading, rng.gauss(0.0, 1.5), rng.gauss(0.0, 1.5)))
+    return frames
+
+
+def lidar_message(seq, front, left=None, right=None, ts=None):
+    return json.dumps({
+        'seq': seq,
+        'ts': ts if ts is not None else time.strftime('%H:%M:%S'),
+        'front_mm': front,
+        'left_mm': left,
+        'right_mm': right,
+    })
+
+
+def imu_messages(heading, ts=None):
+    # imu.py publishes [b"imu", payload] as two frames and the listener reads
+    # them with recv_string(), so each reading arrives as two messages.
+    payload = json.dumps({"ts": ts if ts is not None else time.time(), "heading": round(heading, 2)})
+    return ["imu", payload]
+
+
+def synthetic_messages(duration_s=5.0, lidar_hz=50.0, imu_hz=100.0, seed=0):
+    rng = random.Random(seed)
+    events = []
+    seq = 0
+    t = 0.0
+    while t < duration_s:
+        seq += 1
+        front = round(max(200.0, 2500.0 - 900.0 * (t % 2.5) + rng.gauss(0.0, 10.0)), 2)
+        left = round(500.0 + rng.gauss(0.0, 15.0), 2)
+        right = round(1500.0 + rng.gauss(0.0, 15.0), 2)
+        events.append((t, lidar_message(seq, front, left, right, ts="00:00:00")))
+        t += 1.0 / lidar_hz
+    t = 0.0
+    heading = 0.0
+    while t < duration_s:
+        heading = (heading - rng.uniform(0.0, 0.6)) % 360.0
+        for msg in imu_messages(heading, ts=round(1700000000.0 + t, 6)):
+            events.append((t, msg))
+        t += 1.0 / imu_hz
+    events.sort(key=lambda e: e[0])
+    return events
@@ -0,0 +1,68 @@
+"""Per-function benchmarks for the sensor hot paths."""
+import os
+
+from bench import generators, timing, traces
+
+NAMES = (
+    "lidar.filter_points[front]",
+    "lidar.filter_points[side]",
+    "lidar.summarize_scan",
+    "imu.parse_euler_response",
+    "OpenChallenge.decode_sensor_message",
+)
+
+
+def _inputs(fixtures_dir, quick):
+    def fixture(name, loader, fallback):
+        path = os.path.join(fixtures_dir, name) if fixtures_dir else None
+        if path and os.path.exists(path):
+            return loader(path), {"source": traces.fixture_origin(path), "fixture": name}
+        return fallback(), {"source": "synthetic", "fixture": None}
+
+    scans = fixture(traces.SCANS_FILE, traces.load_scans,
+                    lambda: generators.synthetic_scans(4 if quick else 16))
+    frames = fixture(traces.IMU_FRAMES_FILE, traces.load_imu_frames,
+                     lambda: generators.synthetic_imu_frames(1000))
+    messages = fixture(traces.MESSAGES_FILE, traces.load_messages,
+                       lambda: [m for _, m in generators.synthetic_messages()])
+    return scans, frames, messages
+
+
+def run(fixtures_dir=traces.FIXTURES_DIR, quick=False):
+    import imu
+    import lidar
+    import OpenChallenge
+
+    (scans, scan_src), (frames, frame_src), (messages, msg_src) = _inputs(fixtures_dir, quick)
+    min_time = 0.1 if quick else 0.5
+    scan_samples = 500 if quick else 5000
+    small_samples = 5000 if quick else 50000
+    points = sum(len(s) for s in scans) / len(scans)
+
+    results = []
+    results.append(timing.bench_function(
+        "lidar.filter_points[front]",
+        lambda pts: lidar.filter_points(pts, 0, width=lidar.FRONT_ANGLE_WIDTH),
+        scans, min_time=min_time, latency_samples=scan_samples, unit="scans",
+        params=dict(scan_src, points_per_scan=round(points, 1))))
+    results.append(timing.bench_function(
+        "lidar.filter_points[side]",
+        lambda pts: lidar.filter_points(pts, 90),
+        scans, min_time=min_time, latency_samples=scan_samples, unit="scans",
+        params=dict(scan_src, points_per_scan=round(points, 1))))
+    results.append(timing.bench_function(
+        "lidar.summarize_scan",
+        lidar.summarize_scan,
+        scans, min_time=min_time, latency_samples=scan_samples, unit="scans",
+        params=dict(scan_src, points_per_scan=round(points, 1))))
+    results.append(timing.bench_function(
+        "imu.parse_euler_response",
+        imu.parse_euler_response,
+        frames, min_time=min_time, latency_samples=small_samples, unit="frames",
+        params=frame_src))
+    results.append(timing.bench_function(
+        "OpenChallenge.decode_sensor_message",
+        OpenChallenge.decode_sensor_message,
+        messages, min_time=min_time, latency_samples=small_samples, unit="messages",
+        params=msg_src))
+    return results
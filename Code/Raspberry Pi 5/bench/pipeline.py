@@ -0,0 +1,300 @@
+"""End-to-end benchmark: sensor message in -> drive command out.
+
+OpenChallenge.process_queue() runs unmodified; only its two worker threads are
+replaced. The sensor worker feeds raw message strings through
+decode_sensor_message() exactly like zmq_listener_thread, and the serial
+worker records each command as it is dequeued and acknowledges it at once,
+without the ESP32's SERIAL_CMD_RESPONSE_WAIT. A scripted lap then drives the
+state machine through all twelve turns.
+
+Most of the stimulus -> command time is process_queue sleeping until its
+next tick, which would hide any change in the code itself. TickClock stands
+in for OpenChallenge's asyncio module and timestamps every wake-up of the
+main loop, so the reported latency starts at the wake-up that acted on the
+stimulus; the scheduled wait before it is reported separately. Stimuli are
+sent at a random phase of the tick. Its asyncio.Queue also counts items
+taken, which is how the sensor worker's queue reports when a burst has been
+drained.
+
+  pipeline.turn_trigger   wake with front_mm below threshold -> turn command
+  pipeline.turn_complete  wake with heading on target        -> forward command
+  pipeline.tick           one idle pass of the main loop, wake -> next sleep
+  pipeline.sensor_flood   burst of IMU messages decoded and drained by
+                          sensor_drain_task
+"""
+import asyncio
+import bisect
+import contextlib
+import io
+import queue
+import random
+import time
+
+from bench import generators, timing
+
+NEAR_FRONT_MM = 500.0
+FAR_FRONT_MM = 2000.0
+TURNS_PER_LAP = 12
+# Sleep periods hard-coded in OpenChallenge.process_queue().
+LOOP_PERIOD_S = 0.05
+TURN_POLL_S = 0.02
+# Idle main-loop passes left between turns so pipeline.tick has samples.
+IDLE_TICKS_PER_TURN = 2
+NAMES = ("pipeline.turn_trigger", "pipeline.turn_complete", "pipeline.tick", "pipeline.sensor_flood")
+
+
+def parse_drive_command(cmd):
+    fields = {}
+    for part in cmd.split(","):
+        key, _, value = part.partition(":")
+        try:
+            fields[key.strip()] = float(value)
+        except ValueError:
+            fields[key.strip()] = value
+    return fields
+
+
+def _resolve(fut, value):
+    if not fut.done():
+        fut.set_result(value)
+
+
+class CountingQueue(asyncio.Queue):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.taken = 0
+        self.last_taken = None
+
+    async def get(self):
+        item = await super().get()
+        self.taken += 1
+        self.last_taken = time.perf_counter()
+        return item
+
+
+class TickClock:
+    Queue = CountingQueue
+
+    def __init__(self):
+        self.task = None
+        self.wakes = []
+        self.segments = []
+        self._last_wake = None
+        self._last_delay = None
+
+    def __getattr__(self, name):
+        return getattr(asyncio, name)
+
+    async def sleep(self, delay, result=None):
+        task = asyncio.current_task()
+        main = task is self.task and delay > 0
+        if main and self._last_wake is not None:
+            self.segments.append((self._last_delay, delay, self._last_wake, time.perf_counter()))
+        value = await asyncio.sleep(delay, result)
+        if main:
+            self._last_wake = time.perf_counter()
+            self._last_delay = delay
+            self.wakes.append(self._last_wake)
+        return value
+
+    def wake_before(self, t):
+        i = bisect.bisect_right(self.wakes, t) - 1
+        return self.wakes[i] if i >= 0 else None
+
+
+class PipelineHarness:
+    def __init__(self, decode):
+        self.decode = decode
+        self.inbound = queue.Queue()
+        self.serial_lines = queue.Queue()
+        self.commands = queue.Queue()
+        self.seq = 0
+        self.messages_in = 0
+        self.sensor_queue = None
+
+    def sensor_worker(self, loop, sensor_queue, stop_event):
+        self.sensor_queue = sensor_queue
+        while not stop_event.is_set():
+            try:
+                msg = self.inbound.get(timeout=0.01)
+            except queue.Empty:
+                continue
+            data = self.decode(msg)
+            loop.call_soon_threadsafe(sensor_queue.put_nowait, data)
+
+    def serial_worker(self, loop, serial_in_queue, cmd_queue, stop_event):
+        while not stop_event.is_set():
+            try:
+                line = self.serial_lines.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                loop.call_soon_threadsafe(serial_in_queue.put_nowait, line)
+            try:
+                cmd, fut = cmd_queue.get(timeout=0.001)
+            except queue.Empty:
+                continue
+            self.commands.put((time.perf_counter(), cmd))
+            loop.call_soon_threadsafe(_resolve, fut, "OK")
+
+    def send_raw(self, messages):
+        for msg in messages:
+            self.inbound.put(msg)
+        self.messages_in += len(messages)
+
+    def send_lidar(self, front):
+        self.seq += 1
+        self.send_raw([generators.lidar_message(self.seq, front)])
+
+    def send_imu(self, heading):
+        self.send_raw(generators.imu_messages(heading))
+
+    def wait_drained(self, count, timeout):
+        q = self.sensor_queue
+        if not isinstance(q, CountingQueue):
+            raise RuntimeError("sensor worker was not handed a CountingQueue; "
+                               "process_queue must create its queues through TickClock")
+        deadline = time.perf_counter() + timeout
+        while q.taken < count:
+            if time.perf_counter() > deadline:
+                raise TimeoutError("sensor queue not drained within %.1fs (%d of %d taken)"
+                                   % (timeout, q.taken, count))
+            time.sleep(0.0005)
+        return q.last_taken
+
+    def wait_command(self, predicate, timeout):
+        deadline = time.perf_counter() + timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise TimeoutError("no matching drive command within %.1fs" % timeout)
+            try:
+                t, cmd = self.commands.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            fields = parse_drive_command(cmd)
+            if predicate(fields):
+                return t, fields
+
+
+def _lap(oc, h, clock, flood, timeout, rng):
+    def servo_is(value):
+        return lambda f: f.get("S") == value and f.get("MA") != 0
+
+    def timed(t0, t1, into):
+        wake = clock.wake_before(t1)
+        into.append((t0, wake, t1))
+
+    h.send_imu(0.0)
+    h.send_lidar(FAR_FRONT_MM)
+    time.sleep(0.1)
+    h.serial_lines.put("Start")
+    h.wait_command(servo_is(oc.SERVO_FORWARD), timeout)
+
+    trigger = []
+    complete = []
+    bursts = []
+    heading = 0.0
+    target = (heading - (oc.FIRST_TURN_ANGLE + oc.TURN_OFFSET)) % 360
+    for _ in range(TURNS_PER_LAP):
+        if flood:
+            burst = [m for _ in range(flood) for m in generators.imu_messages(heading)]
+            t_flood = time.perf_counter()
+            h.send_raw(burst)
+            t_drained = h.wait_drained(h.messages_in, timeout)
+            bursts.append((len(burst), t_drained - t_flood))
+
+        time.sleep(IDLE_TICKS_PER_TURN * LOOP_PERIOD_S + rng.uniform(0.0, LOOP_PERIOD_S))
+        t0 = time.perf_counter()
+        h.send_lidar(NEAR_FRONT_MM)
+        t1, _ = h.wait_command(servo_is(oc.SERVO_LEFT), timeout)
+        timed(t0, t1, trigger)
+
+        h.send_lidar(FAR_FRONT_MM)
+        heading = target
+        time.sleep(rng.uniform(0.0, TURN_POLL_S))
+        t0 = time.perf_counter()
+        h.send_imu(heading)
+        t1, _ = h.wait_command(servo_is(oc.SERVO_FORWARD), timeout)
+        timed(t0, t1, complete)
+        target = (target - (oc.TURN_ANGLE + oc.TURN_OFFSET)) % 360
+
+    t_park, _ = h.wait_command(lambda f: f.get("MA") == 0 and f.get("MB") == 0, timeout)
+    return trigger, complete, bursts, t_park
+
+
+def run_lap(flood=0, timeout=5.0, seed=None):
+    import OpenChallenge as oc
+
+    h = PipelineHarness(oc.decode_sensor_message)
+    clock = TickClock()
+    rng = random.Random(seed)
+    oc._stop_event.clear()
+    while True:
+        try:
+            oc._serial_cmd_queue.get_nowait()
+        except queue.Empty:
+            break
+
+    async def main():
+        task = asyncio.create_task(oc.process_queue(sensor_worker=h.sensor_worker, serial_worker=h.serial_worker))
+        clock.task = task
+        try:
+            return await asyncio.to_thread(_lap, oc, h, clock, flood, timeout, rng)
+        finally:
+            # wait_for() in send_command() can swallow a cancel that lands
+            # while its future is being resolved, so keep cancelling.
+            while not task.done():
+                task.cancel()
+                await asyncio.wait({task}, timeout=0.1)
+            with contextlib.suppress(asyncio.CancelledError):
+                task.result()
+
+    real_asyncio = oc.asyncio
+    oc.asyncio = clock
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            trigger, complete, bursts, t_park = asyncio.run(main())
+    finally:
+        oc.asyncio = real_asyncio
+    ticks = [end - wake for prev, nxt, wake, end in clock.segments
+             if prev == nxt == LOOP_PERIOD_S and end < t_park]
+    return trigger, complete, ticks, bursts
+
+
+def _stage_result(name, events, params):
+    return timing.pipeline_result(
+        name, [t1 - wake for _, wake, t1 in events], None, len(events), "turns", params,
+        scheduled_wait_us=timing.latency_summary([int((wake - t0) * 1e9) for t0, wake, _ in events]),
+        end_to_end_us=timing.latency_summary([int((t1 - t0) * 1e9) for t0, _, t1 in events]))
+
+
+def run(laps=3, flood=2000, seed=0):
+    trigger = []
+    complete = []
+    ticks = []
+    for lap in range(laps):
+        t, c, k, _ = run_lap(seed=seed + lap)
+        trigger += t
+        complete += c
+        ticks += k
+
+    params = {"laps": laps, "turns_per_lap": TURNS_PER_LAP, "loop_period_s": LOOP_PERIOD_S,
+              "turn_poll_s": TURN_POLL_S, "serial_response_wait_s": 0.0}
+    results = []
+    # Rows without samples would only add empty entries to compared files.
+    if trigger:
+        results.append(_stage_result("pipeline.turn_trigger", trigger, params))
+    if complete:
+        results.append(_stage_result("pipeline.turn_complete", complete, params))
+    if ticks:
+        results.append(timing.pipeline_result("pipeline.tick", ticks, sum(ticks), len(ticks), "ticks", params))
+
+    if flood:
+        _, _, _, bursts = run_lap(flood=flood, seed=seed + laps)
+    if flood and bursts:
+        results.append(timing.pipeline_result(
+            "pipeline.sensor_flood", [s for _, s in bursts], sum(s for _, s in bursts),
+            sum(n for n, _ in bursts), "messages",
+            {"messages_per_burst": 2 * flood, "bursts": len(bursts)}))
+    return results
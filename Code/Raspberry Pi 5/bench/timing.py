@@ -0,0 +1,94 @@
+"""Throughput and latency measurement helpers.
+
+Throughput is measured with a tight loop over the inputs (no per-call timer);
+latency is a separate pass that times each call with perf_counter_ns(), so
+the timer overhead only shows up in the latency figures.
+"""
+import math
+import statistics
+import time
+
+
+def latency_summary(samples_ns):
+    if not samples_ns:
+        return {}
+    data = sorted(samples_ns)
+
+    def pct(p):
+        k = (len(data) - 1) * p / 100.0
+        lo = math.floor(k)
+        hi = math.ceil(k)
+        return data[lo] + (data[hi] - data[lo]) * (k - lo)
+
+    to_us = 1e-3
+    return {
+        "min": round(data[0] * to_us, 3),
+        "mean": round(statistics.fmean(data) * to_us, 3),
+        "p50": round(pct(50) * to_us, 3),
+        "p90": round(pct(90) * to_us, 3),
+        "p99": round(pct(99) * to_us, 3),
+        "max": round(data[-1] * to_us, 3),
+        "stdev": round(statistics.pstdev(data) * to_us, 3),
+        "samples": len(data),
+    }
+
+
+def bench_function(name, func, inputs, min_time=0.5, latency_samples=20000, warmup=100, unit="calls", params=None):
+    inputs = list(inputs)
+    if not inputs:
+        raise ValueError(f"{name}: no inputs to benchmark")
+    n = len(inputs)
+
+    for i in range(min(warmup, n)):
+        func(inputs[i])
+
+    calls = 0
+    perf_counter = time.perf_counter
+    start = perf_counter()
+    deadline = start + min_time
+    while True:
+        for arg in inputs:
+            func(arg)
+        calls += n
+        now = perf_counter()
+        if now >= deadline:
+            break
+    elapsed = now - start
+
+    samples = []
+    clock = time.perf_counter_ns
+    i = 0
+    while len(samples) < latency_samples:
+        arg = inputs[i % n]
+        t0 = clock()
+        func(arg)
+        samples.append(clock() - t0)
+        i += 1
+
+    return {
+        "name": name,
+        "kind": "function",
+        "unit": unit,
+        "calls": calls,
+        "elapsed_s": round(elapsed, 6),
+        "throughput_per_s": round(calls / elapsed, 3),
+        "latency_us": latency_summary(samples),
+        "params": dict(params or {}, inputs=n),
+    }
+
+
+def pipeline_result(name, latencies_s, elapsed, count, unit, params=None, **extra):
+    # elapsed is the time spent in the stage itself; pass None when there is
+    # no meaningful busy time to divide by and throughput is not reported.
+    result = {
+        "name": name,
+        "kind": "pipeline",
+        "unit": unit,
+        "calls": count,
+        "elapsed_s": round(elapsed, 6) if elapsed is not None else None,
+        "throughput_per_s": round(count / elapsed, 3) if elapsed else None,
+        "latency_us": latency_summary([int(s * 1e9) for s in latencies_s]),
+    }
+    result.update(extra)
+    result["params"] = dict(params or {})
+    return result
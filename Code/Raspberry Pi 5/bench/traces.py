@@ -0,0 +1,229 @@
+"""Trace fixtures for the benchmarks, stored as JSON lines.
+
+    scans.jsonl     {"t": s, "points": [[q, a_deg, d_mm], ...]}  one lidar.process_queue drain
+    imu_frames.jsonl {"t": s, "hex": "bb06..."}                  one BNO055 Euler read response
+    messages.jsonl  {"t": s, "msg": "..."}                        one recv_string() frame
+
+Record real traces on the robot (with the other scripts stopped where they
+would hold the same device):
+
+    python3 -m bench.traces record messages --duration 30 -o bench/fixtures/messages.jsonl
+    python3 -m bench.traces record scans --duration 10 -o bench/fixtures/scans.jsonl
+    python3 -m bench.traces record imu --duration 10 -o bench/fixtures/imu_frames.jsonl
+
+or regenerate the synthetic set with "python3 -m bench.traces synth".
+Each fixture directory keeps a manifest.json recording whether every file
+was generated or recorded, so results can report where their data came from.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from bench import generators
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SCANS_FILE = "scans.jsonl"
+IMU_FRAMES_FILE = "imu_frames.jsonl"
+MESSAGES_FILE = "messages.jsonl"
+MANIFEST_FILE = "manifest.json"
+
+
+def write_jsonl(path, records):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        for rec in records:
+            f.write(json.dumps(rec, separators=(",", ":")) + "\n")
+
+
+def read_jsonl(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _manifest_path(path):
+    return os.path.join(os.path.dirname(os.path.abspath(path)), MANIFEST_FILE)
+
+
+def read_manifest(path):
+    try:
+        with open(_manifest_path(path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def update_manifest(path, origin, **info):
+    manifest = read_manifest(path)
+    manifest[os.path.basename(path)] = dict(info, origin=origin,
+                                            created=time.strftime("%Y-%m-%dT%H:%M:%S%z"))
+    with open(_manifest_path(path), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def fixture_origin(path):
+    return read_manifest(path).get(os.path.basename(path), {}).get("origin", "unknown")
+
+
+def load_scans(path):
+    return [[{"q": q, "a_deg": a, "d_mm": d} for q, a, d in rec["points"]] for rec in read_jsonl(path)]
+
+
+def load_imu_frames(path):
+    return [bytes.fromhex(rec["hex"]) for rec in read_jsonl(path)]
+
+
+def load_messages(path):
+    return [rec["msg"] for rec in read_jsonl(path)]
+
+
+def scan_records(scans, period=0.1):
+    return [{"t": round(i * period, 4), "points": [[p["q"], p["a_deg"], p["d_mm"]] for p in scan]}
+            for i, scan in enumerate(scans)]
+
+
+def synth(out_dir=FIXTURES_DIR, seed=0):
+    scans = generators.synthetic_scans(8, seed=seed)
+    for scan in scans:
+        for p in scan:
+            p["a_deg"] = round(p["a_deg"], 3)
+    path = os.path.join(out_dir, SCANS_FILE)
+    write_jsonl(path, scan_records(scans))
+    update_manifest(path, "synthetic", generator="synthetic_scans", seed=seed)
+
+    frames = generators.synthetic_imu_frames(400, seed=seed)
+    path = os.path.join(out_dir, IMU_FRAMES_FILE)
+    write_jsonl(path, [{"t": round(i * 0.01, 4), "hex": fr.hex()} for i, fr in enumerate(frames)])
+    update_manifest(path, "synthetic", generator="synthetic_imu_frames", seed=seed)
+
+    messages = generators.synthetic_messages(duration_s=4.0, seed=seed)
+    path = os.path.join(out_dir, MESSAGES_FILE)
+    write_jsonl(path, [{"t": round(t, 4), "msg": msg} for t, msg in messages])
+    update_manifest(path, "synthetic", generator="synthetic_messages", seed=seed)
+
+
+def record_messages(duration, ports=None):
+    import zmq
+    import OpenChallenge
+
+    ports = ports or (OpenChallenge.ZMQ_PORT_LIDAR, OpenChallenge.ZMQ_PORT_IMU)
+    ctx = zmq.Context()
+    sock = ctx.socket(zmq.SUB)
+    sock.setsockopt_string(zmq.SUBSCRIBE, "")
+    for port in ports:
+        sock.connect(f"tcp://localhost:{port}")
+    sock.setsockopt(zmq.RCVTIMEO, OpenChallenge.ZMQ_RECV_TIMEOUT_MS)
+    records = []
+    start = time.perf_counter()
+    try:
+        while time.perf_counter() - start < duration:
+            try:
+                msg = sock.recv_string()
+            except zmq.Again:
+                continue
+            records.append({"t": round(time.perf_counter() - start, 6), "msg": msg})
+    finally:
+        sock.close()
+        ctx.term()
+    return records
+
+
+async def _record_scans(duration):
+    from rplidarc1 import RPLidar
+    import lidar
+
+    dev = RPLidar(lidar.PORT, lidar.BAUDRATE)
+    records = []
+    start = time.perf_counter()
+
+    async def drain():
+        while time.perf_counter() - start < duration:
+            batch = []
+            try:
+                while True:
+                    p = dev.output_queue.get_nowait()
+                    batch.append([p.get("q"), p.get("a_deg"), p.get("d_mm")])
+            except asyncio.QueueEmpty:
+                pass
+            if batch:
+                records.append({"t": round(time.perf_counter() - start, 6), "points": batch})
+            await asyncio.sleep(lidar.PUBLISH_INTERVAL)
+        dev.stop_event.set()
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(drain())
+            tg.create_task(dev.simple_scan(make_return_dict=True))
+    finally:
+        try:
+            dev.reset()
+        except Exception:
+            pass
+    return records
+
+
+def record_scans(duration):
+    return asyncio.run(_record_scans(duration))
+
+
+def record_imu(duration):
+    import serial
+    import imu
+
+    cmd = bytearray([0xAA, 0x01, imu.EULER_H_LSB, 0x06])
+    records = []
+    with serial.Serial(imu.SERIAL_PORT, imu.BAUD_RATE, timeout=0.1) as ser:
+        imu.set_operation_mode(ser, imu.CONFIG_MODE)
+        time.sleep(0.02)
+        imu.set_operation_mode(ser, imu.NDOF_MODE)
+        time.sleep(0.3)
+        start = time.perf_counter()
+        while time.perf_counter() - start < duration:
+            response = imu.send_command(ser, cmd, timeout=0.04)
+            records.append({"t": round(time.perf_counter() - start, 6), "hex": (response or b"").hex()})
+            time.sleep(imu.REFRESH_INTERVAL)
+    return records
+
+
+RECORDERS = {
+    "messages": (record_messages, MESSAGES_FILE),
+    "scans": (record_scans, SCANS_FILE),
+    "imu": (record_imu, IMU_FRAMES_FILE),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python3 -m bench.traces", description="Create benchmark trace fixtures.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_synth = sub.add_parser("synth", help="regenerate the synthetic fixtures")
+    p_synth.add_argument("-o", "--output-dir", default=FIXTURES_DIR)
+    p_synth.add_argument("--seed", type=int, default=0)
+    p_rec = sub.add_parser("record", help="record a trace from the live sensors")
+    p_rec.add_argument("source", choices=sorted(RECORDERS))
+    p_rec.add_argument("--duration", type=float, default=10.0)
+    p_rec.add_argument("-o", "--output")
+    args = parser.parse_args(argv)
+
+    if args.command == "synth":
+        synth(args.output_dir, args.seed)
+        print(f"Synthetic fixtures written to {args.output_dir}")
+        return 0
+
+    recorder, default_name = RECORDERS[args.source]
+    output = args.output or os.path.join(FIXTURES_DIR, default_name)
+    try:
+        records = recorder(args.duration)
+    except KeyboardInterrupt:
+        print("Recording interrupted.", file=sys.stderr)
+        return 1
+    write_jsonl(output, records)
+    update_manifest(output, "recorded", source=args.source, duration_s=args.duration)
+    print(f"Recorded {len(records)} {args.source} records to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
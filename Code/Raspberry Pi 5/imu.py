@@ -1,8 +1,10 @@
 import serial
+import sys
 import time
 import struct
 import json
 import zmq
+import profiling
 
 SERIAL_PORT = '/dev/imu'
 BAUD_RATE = 115200
@@ -48,9 +50,7 @@ def set_operation_mode(ser, mode):
     else:
         print(f"Warning: unexpected set mode response: {response}")
 
-def read_euler_angles(ser):
-    cmd = bytearray([0xAA, 0x01, EULER_H_LSB, 0x06])
-    response = send_command(ser, cmd, timeout=0.04)
+def parse_euler_response(response):
     if not response:
         return None
     if len(response) >= 8 and response[0] == 0xBB and response[1] == 0x06:
@@ -62,52 +62,61 @@ def read_euler_angles(ser):
             return None
     return None
 
-try:
-    with serial.Serial(SERIAL_PORT, BAUD_RATE, timeout=0.1) as ser:
-        print("Connected to BNO055 via UART.")
-        context = zmq.Context()
-        socket = context.socket(zmq.PUB)
-        socket.setsockopt(zmq.SNDHWM, 1)
-        try:
-            socket.setsockopt(zmq.IMMEDIATE, 1)
-        except Exception:
-            pass
-        socket.setsockopt(zmq.LINGER, 0)
-        zmq_addr = "tcp://*:5001"
-        socket.bind(zmq_addr)
-        time.sleep(0.02)
-        print(f"ZMQ PUB bound to {zmq_addr}")
-        set_operation_mode(ser, CONFIG_MODE)
-        time.sleep(0.02)
-        set_operation_mode(ser, NDOF_MODE)
-        time.sleep(0.3)
-        import sys
-        while True:
-            angles = read_euler_angles(ser)
-            if angles:
-                heading, _roll, _pitch = angles
-                heading = heading % 360.0
-                if OVERWRITE_OUTPUT:
-                    print(f"Heading: {heading:.2f}°", end='\r', flush=True)
+def read_euler_angles(ser):
+    cmd = bytearray([0xAA, 0x01, EULER_H_LSB, 0x06])
+    response = send_command(ser, cmd, timeout=0.04)
+    return parse_euler_response(response)
+
+def main():
+    try:
+        with serial.Serial(SERIAL_PORT, BAUD_RATE, timeout=0.1) as ser:
+            print("Connected to BNO055 via UART.")
+            context = zmq.Context()
+            socket = context.socket(zmq.PUB)
+            socket.setsockopt(zmq.SNDHWM, 1)
+            try:
+                socket.setsockopt(zmq.IMMEDIATE, 1)
+            except Exception:
+                pass
+            socket.setsockopt(zmq.LINGER, 0)
+            zmq_addr = "tcp://*:5001"
+            socket.bind(zmq_addr)
+            time.sleep(0.02)
+            print(f"ZMQ PUB bound to {zmq_addr}")
+            set_operation_mode(ser, CONFIG_MODE)
+            time.sleep(0.02)
+            set_operation_mode(ser, NDOF_MODE)
+            time.sleep(0.3)
+            while True:
+                angles = read_euler_angles(ser)
+                if angles:
+                    heading, _roll, _pitch = angles
+                    heading = heading % 360.0
+                    if OVERWRITE_OUTPUT:
+                        print(f"Heading: {heading:.2f}°", end='\r', flush=True)
+                    else:
+                        print(f"Heading: {heading:.2f}°")
+                    payload = json.dumps({
+                        "ts": time.time(),
+                        "heading": round(heading, 2)
+                    })
+                    try:
+                        socket.send_multipart([b"imu", payload.encode('utf-8')], zmq.NOBLOCK)
+                    except zmq.Again:
+                        pass
+                    except Exception as e:
+                        print(f"ZMQ publish error: {e}", file=sys.stderr)
                 else:
-                    print(f"Heading: {heading:.2f}°")
-                payload = json.dumps({
-                    "ts": time.time(),
-                    "heading": round(heading, 2)
-                })
-                try:
-                    socket.send_multipart([b"imu", payload.encode('utf-8')], zmq.NOBLOCK)
-                except zmq.Again:
-                    pass
-                except Exception as e:
-                    print(f"ZMQ publish error: {e}", file=sys.stderr)
-            else:
-                if not OVERWRITE_OUTPUT:
-                    print("Waiting for valid heading...")
-            time.sleep(REFRESH_INTERVAL)
-        socket.close()
-        context.term()
-except serial.SerialException as e:
-    print(f"Serial error: {e}")
-except KeyboardInterrupt:
-    print("Stopped.")
\ No newline at end of file
+                    if not OVERWRITE_OUTPUT:
+                        print("Waiting for valid heading...")
+                time.sleep(REFRESH_INTERVAL)
+            socket.close()
+            context.term()
+    except serial.SerialException as e:
+        print(f"Serial error: {e}")
+    except KeyboardInterrupt:
+        print("Stopped.")
+
+if __name__ == "__main__":
+    with profiling.profiled("imu"):
+        main()
@@ -2,6 +2,7 @@ import asyncio
 import sys
 import time
 from rplidarc1 import RPLidar
+import profiling
 
 PORT = "/dev/lidar"
 BAUDRATE = 460800
@@ -13,7 +14,7 @@ ZMQ_PORT = 5000
 PUBLISH_INTERVAL = 0.02
 ZMQ_SNDHWM = 1
 
-lidar = RPLidar(PORT, BAUDRATE)
+lidar = None
 
 
 def _angle_diff(a, b):
@@ -28,6 +29,15 @@ def filter_points(points, target_angle, width=ANGLE_WIDTH, count=POINTS_PER_SIDE
     return filtered[:count]
 
 
+def summarize_scan(points):
+    front_point = filter_points(points, 0, width=FRONT_ANGLE_WIDTH)
+    left_point = filter_points(points, 90)
+    right_point = filter_points(points, 270)
+    return (front_point[0] if front_point else None,
+            left_point[0] if left_point else None,
+            right_point[0] if right_point else None)
+
+
 async def process_scan_data():
     zmq_ctx = None
     zmq_sock = None
@@ -83,13 +93,11 @@ async def process_queue(queue, stop_event, zmq_socket=None):
             pass
 
         if all_points:
-            front_point = filter_points(all_points, 0, width=FRONT_ANGLE_WIDTH)
-            left_point = filter_points(all_points, 90)
-            right_point = filter_points(all_points, 270)
+            front, left, right = summarize_scan(all_points)
 
-            last_front = front_point[0] if front_point else last_front
-            last_left = left_point[0] if left_point else last_left
-            last_right = right_point[0] if right_point else last_right
+            last_front = front if front is not None else last_front
+            last_left = left if left is not None else last_left
+            last_right = right if right is not None else last_right
 
         ts = time.strftime('%H:%M:%S')
         out = (f"[{ts}] Front: {last_front if last_front is not None else 'N/A'} mm | "
@@ -118,11 +126,14 @@ async def process_queue(queue, stop_event, zmq_socket=None):
         await asyncio.sleep(PUBLISH_INTERVAL)
 
 
-try:
-    asyncio.run(process_scan_data())
-except KeyboardInterrupt:
-    print("Stopping Lidar...")
+if __name__ == "__main__":
+    lidar = RPLidar(PORT, BAUDRATE)
     try:
-        lidar.reset()
-    except Exception:
-        pass
\ No newline at end of file
+        with profiling.profiled("lidar"):
+            asyncio.run(process_scan_data())
+    except KeyboardInterrupt:
+        print("Stopping Lidar...")
+        try:
+            lidar.reset()
+        except Exception:
+            pass
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""Opt-in profiling for the live scripts.
+
+Set WRO_PROFILE before launching a script to switch it on:
+
+    WRO_PROFILE=cprofile python3 OpenChallenge.py   # <name>-<pid>.prof (pstats)
+    WRO_PROFILE=sample python3 lidar.py             # <name>-<pid>.sample.json
+
+cProfile only sees the thread that enters profiled(), i.e. the asyncio loop.
+The sampler walks every thread, so it also covers the ZMQ and serial workers.
+Output goes to WRO_PROFILE_DIR (default "profiles"); the sampling period is
+WRO_PROFILE_INTERVAL seconds (default 0.005).
+
+start.sh stops the scripts with kill, so while profiling is on SIGTERM is
+turned into KeyboardInterrupt to let the profile be written on the way out.
+"""
+import contextlib
+import json
+import os
+import signal
+import sys
+import threading
+import time
+
+PROFILE_ENV = "WRO_PROFILE"
+PROFILE_DIR_ENV = "WRO_PROFILE_DIR"
+PROFILE_INTERVAL_ENV = "WRO_PROFILE_INTERVAL"
+
+DEFAULT_PROFILE_DIR = "profiles"
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+
+def _output_path(name, suffix):
+    out_dir = os.environ.get(PROFILE_DIR_ENV, DEFAULT_PROFILE_DIR)
+    os.makedirs(out_dir, exist_ok=True)
+    return os.path.join(out_dir, f"{name}-{os.getpid()}{suffix}")
+
+
+class StackSampler:
+    def __init__(self, interval=DEFAULT_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks = {}
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._started = None
+        self._elapsed = 0.0
+
+    def _collapse(self, frame):
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                key = self._collapse(frame)
+                self.stacks[key] = self.stacks.get(key, 0) + 1
+            self.samples += 1
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        if self._started is not None:
+            self._elapsed = time.perf_counter() - self._started
+
+    def to_dict(self):
+        return {
+            "interval_s": self.interval,
+            "duration_s": round(self._elapsed, 3),
+            "samples": self.samples,
+            "stacks": dict(sorted(self.stacks.items(), key=lambda kv: kv[1], reverse=True)),
+        }
+
+
+def _sample_interval():
+    raw = os.environ.get(PROFILE_INTERVAL_ENV)
+    if raw is None:
+        return DEFAULT_SAMPLE_INTERVAL
+    try:
+        interval = float(raw)
+        if interval <= 0:
+            raise ValueError(raw)
+    except ValueError:
+        print(f"[profile] invalid {PROFILE_INTERVAL_ENV}={raw!r}, expected seconds > 0; "
+              f"using {DEFAULT_SAMPLE_INTERVAL}", file=sys.stderr)
+        return DEFAULT_SAMPLE_INTERVAL
+    return interval
+
+
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+@contextlib.contextmanager
+def _sigterm_as_interrupt():
+    try:
+        previous = signal.signal(signal.SIGTERM, _raise_interrupt)
+    except ValueError:
+        # Not the main thread; signal handlers cannot be installed here.
+        yield
+        return
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+
+
+@contextlib.contextmanager
+def profiled(name, mode=None):
+    mode = (mode if mode is not None else os.environ.get(PROFILE_ENV, "")).strip().lower()
+    if mode in ("", "0", "off", "none"):
+        yield None
+        return
+
+    if mode == "cprofile":
+        import cProfile
+        prof = cProfile.Profile()
+        with _sigterm_as_interrupt():
+            prof.enable()
+            try:
+                yield prof
+            finally:
+                prof.disable()
+                path = _output_path(name, ".prof")
+                prof.dump_stats(path)
+                print(f"\n[profile] cProfile stats written to {path}", file=sys.stderr)
+    elif mode == "sample":
+        sampler = StackSampler(_sample_interval())
+        with _sigterm_as_interrupt():
+            sampler.start()
+            try:
+                yield sampler
+            finally:
+                sampler.stop()
+                path = _output_path(name, ".sample.json")
+                with open(path, "w") as f:
+                    json.dump(sampler.to_dict(), f, indent=1)
+                print(f"\n[profile] {sampler.samples} samples written to {path}", file=sys.stderr)
+    else:
+        print(f"[profile] unknown {PROFILE_ENV}={mode!r}, expected 'cprofile' or 'sample'; profiling disabled",
+              file=sys.stderr)
+        yield None